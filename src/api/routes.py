@@ -35,6 +35,8 @@ from src.gradio.app import (
     get_character_response_stream,
     deliberate,
     CHARACTERS as CHARACTER_LIST,
+    CHAT_CONTEXT_MESSAGES,
+    CHAT_CALL_SPACING_SECONDS,
     sanitize_tool_calls,
 )
 
@@ -112,7 +114,7 @@ async def chat_endpoint(req: ChatRequest):
     # Build LLM history from request history
     llm_history = [
         {"role": msg.role, "content": msg.content}
-        for msg in req.history[-5:]  # Last 5 messages for context
+        for msg in req.history[-CHAT_CONTEXT_MESSAGES:]
     ]
     
     # Collect responses
@@ -121,35 +123,32 @@ async def chat_endpoint(req: ChatRequest):
         content=req.message,
         timestamp=_now_iso(),
     )
-    new_messages: list[Message] = []
     
-    for char in responding_chars:
+    async def reply(slot: int, char) -> Message:
+        # characters answer concurrently; staggered starts keep the old spacing between requests
+        await asyncio.sleep(slot * CHAT_CALL_SPACING_SECONDS)
         try:
-            full_response = ""
-            async for chunk in get_character_response_stream(
-                char, req.message, llm_history, user_key=req.api_key
-            ):
-                full_response += chunk
-            
-            new_messages.append(Message(
-                role="assistant",
-                content=sanitize_tool_calls(full_response.strip()),
-                speaker=char.name,
-                emoji=getattr(char, "emoji", "💬"),
-                timestamp=_now_iso(),
-            ))
-            
-            await asyncio.sleep(0.5)  # Rate limiting between characters
-            
+            full_response = "".join([
+                chunk async for chunk in get_character_response_stream(
+                    char, req.message, llm_history, user_key=req.api_key
+                )
+            ])
+            content = sanitize_tool_calls(full_response.strip())
         except Exception as e:
             logger.error(f"Error getting response from {char.name}: {e}")
-            new_messages.append(Message(
-                role="assistant",
-                content=f"*{char.name} seems distracted*",
-                speaker=char.name,
-                emoji=getattr(char, "emoji", "💬"),
-                timestamp=_now_iso(),
-            ))
+            content = f"*{char.name} seems distracted*"
+        return Message(
+            role="assistant",
+            content=content,
+            speaker=char.name,
+            emoji=getattr(char, "emoji", "💬"),
+            timestamp=_now_iso(),
+        )
+    
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(reply(slot, char)) for slot, char in enumerate(responding_chars)]
+    # responses keep the order the characters were addressed in
+    new_messages: list[Message] = [task.result() for task in tasks]
     
     duration_ms = (time.perf_counter() - start_time) * 1000
     
@@ -220,7 +219,7 @@ async def chat_stream(websocket: WebSocket):
             # Build LLM history
             llm_history = [
                 {"role": msg.get("role", "user"), "content": msg.get("content", "")}
-                for msg in history[-5:]
+                for msg in history[-CHAT_CONTEXT_MESSAGES:]
             ]
             
             # Stream responses from each character
@@ -230,19 +229,19 @@ async def chat_stream(websocket: WebSocket):
                     WSChatMessage(type="start", character=char.name).model_dump()
                 )
                 
-                full_response = ""
+                response_parts: list[str] = []
                 try:
                     async for chunk in get_character_response_stream(
                         char, message, llm_history, user_key=api_key
                     ):
                         if chunk:
-                            full_response += chunk
+                            response_parts.append(chunk)
                             await websocket.send_json(
                                 WSChatMessage(type="chunk", character=char.name, content=chunk).model_dump()
                             )
                     
                     # Signal end of this character's response
-                    sanitized = sanitize_tool_calls(full_response.strip())
+                    sanitized = sanitize_tool_calls("".join(response_parts).strip())
                     await websocket.send_json(
                         WSChatMessage(type="done", character=char.name, content=sanitized).model_dump()
                     )
@@ -369,7 +368,7 @@ async def deliberate_stream(websocket: WebSocket):
         # Import what we need for streaming deliberation
         from src.gradio.app import (
             _build_phase_prompt,
-            _history_text,
+            _RollingExcerpt,
             _summarize_cycle,
             _neutral_summary,
             moderator_instance,
@@ -384,6 +383,8 @@ async def deliberate_stream(websocket: WebSocket):
         rng.shuffle(char_order)
         
         conversation_llm = []
+        recent_notes = _RollingExcerpt()
+        recap_notes = _RollingExcerpt(limit=36)
         phases = ["thesis", "antithesis", "synthesis"]
         
         for cycle_idx in range(rounds):
@@ -409,7 +410,7 @@ async def deliberate_stream(websocket: WebSocket):
                     )
                     
                     # Build prompt
-                    history_excerpt = _history_text(conversation_llm)
+                    history_excerpt = recent_notes.text
                     prompt = _build_phase_prompt(
                         phase=phase,
                         char=char,
@@ -418,13 +419,13 @@ async def deliberate_stream(websocket: WebSocket):
                     )
                     
                     # Stream response
-                    full_response = ""
+                    response_parts: list[str] = []
                     try:
                         async for chunk in get_character_response_stream(
                             char, prompt, [], user_key=api_key
                         ):
                             if chunk:
-                                full_response += chunk
+                                response_parts.append(chunk)
                                 await websocket.send_json(
                                     WSDeliberationMessage(
                                         type="chunk",
@@ -434,15 +435,17 @@ async def deliberate_stream(websocket: WebSocket):
                                         content=chunk,
                                     ).model_dump()
                                 )
+                        full_response = "".join(response_parts)
                     except Exception as e:
                         logger.error(f"Deliberation stream error for {char.name}: {e}")
                         full_response = f"*{char.name} could not respond.*"
                     
                     # Sanitize and record
                     full_response = sanitize_tool_calls(full_response.strip())
-                    conversation_llm.append(
-                        f"[{phase.upper()} | Cycle {cycle_idx + 1}] {char.name}: {full_response}"
-                    )
+                    line = f"[{phase.upper()} | Cycle {cycle_idx + 1}] {char.name}: {full_response}"
+                    conversation_llm.append(line)
+                    recent_notes.append(line)
+                    recap_notes.append(line)
                     
                     # Signal character done
                     await websocket.send_json(
@@ -467,7 +470,7 @@ async def deliberate_stream(websocket: WebSocket):
                 )
             
             # Cycle summary
-            cycle_text = _history_text(conversation_llm, limit=36)
+            cycle_text = recap_notes.text
             summary = await _summarize_cycle(cycle_text, user_key=api_key)
             
             await websocket.send_json(
@@ -488,19 +491,18 @@ async def deliberate_stream(websocket: WebSocket):
             )
             summary_author = "Moderator"
         else:
-            name_map = {char.name.lower(): char for char in CHARACTER_LIST}
-            selected = name_map.get(summariser_normalized, moderator_instance)
+            selected = REGISTRY.get(summariser_normalized, moderator_instance)
             summary_author = selected.name if selected != moderator_instance else "Moderator"
             
             summary_prompt = (
                 "Provide a concise synthesis (3 sentences max) from your perspective, "
                 f"referencing the discussion below.\n\n{full_history_text}"
             )
-            full_summary = ""
-            async for chunk in get_character_response_stream(
-                selected, summary_prompt, [], user_key=api_key
-            ):
-                full_summary += chunk
+            full_summary = "".join([
+                chunk async for chunk in get_character_response_stream(
+                    selected, summary_prompt, [], user_key=api_key
+                )
+            ])
             final_summary = sanitize_tool_calls(full_summary.strip())
         
         # Signal done with final summary
@@ -6,7 +6,7 @@ from .crow import Crow
 from .magpie import Magpie
 from .raven import Raven
 from .neutral_moderator import Moderator
-from .registry import register_instance, get_all_characters, REGISTRY
+from .registry import register_instance, shared_instance, get_all_characters, REGISTRY
 
 __all__ = [
     "Character",
@@ -16,6 +16,7 @@ __all__ = [
     "Raven",
     "Moderator",
     "register_instance",
+    "shared_instance",
     "get_all_characters",
     "REGISTRY",
 ]
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
+import asyncio
 import random
 import threading
 import time
@@ -111,6 +112,28 @@ class Character(ABC):
                 until = current_until
         return max(0.0, until - now)
 
+    async def _in_thread(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking provider call in a worker thread.
+
+        The thread can't be interrupted, so if the caller is cancelled this still
+        waits for the call to finish before re-raising. Whoever holds an LLM slot
+        around the call therefore keeps it until the upstream request is over
+        (bounded by the provider timeout).
+        """
+        future = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            while not future.done():
+                try:
+                    # asyncio.wait never cancels what it waits on
+                    await asyncio.wait([future])
+                except asyncio.CancelledError:
+                    continue
+            if not future.cancelled():
+                future.exception()  # the result is discarded; don't warn about it
+            raise
+
     @abstractmethod
     async def respond(self, message: str, history: List[Dict], user_key: Optional[str] = None) -> str:
         """Return character response based on message and conversation history."""
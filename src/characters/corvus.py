@@ -432,7 +432,7 @@ class Corvus(Character):
         
         if self.use_cloud:
             return await self._respond_cloud(message, history, user_key=user_key)
-        return self._respond_ollama(message, history)
+        return await self._in_thread(self._respond_ollama, message, history)
     
     async def _respond_cloud(self, message: str, history: Optional[List[Dict]] = None, user_key: Optional[str] = None) -> str:
         """Use configured cloud providers with tools."""
@@ -452,7 +452,8 @@ class Corvus(Character):
         
         tools = self._get_tool_definitions()
         
-        first_response, _ = self._call_llm(
+        first_response, _ = await self._in_thread(
+            self._call_llm,
             messages=messages,
             tools=tools,
             temperature=0.8,
@@ -504,7 +505,8 @@ class Corvus(Character):
                 })
                 
                 # second LLM call with search results
-                final_response, _ = self._call_llm(
+                final_response, _ = await self._in_thread(
+                    self._call_llm,
                     messages=messages,
                     temperature=0.8,
                     max_tokens=200,  # More tokens for synthesis
@@ -517,7 +517,7 @@ class Crow(Character):
         """Generate a response."""
         if self.use_cloud:
             return await self._respond_cloud(message, history, user_key=user_key)
-        return self._respond_ollama(message, history)
+        return await self._in_thread(self._respond_ollama, message, history)
     
     async def _respond_cloud(self, message: str, history: Optional[List[Dict]] = None, user_key: Optional[str] = None) -> str:
         """Use configured cloud providers with tools."""
@@ -532,7 +532,8 @@ class Crow(Character):
         tools = self._get_tool_definitions()
         
         # first LLM call
-        first_response, _ = self._call_llm(
+        first_response, _ = await self._in_thread(
+            self._call_llm,
             messages=messages,
             tools=tools,
             temperature=0.7,  # Slightly lower for Crow's measured personality
@@ -582,7 +583,8 @@ class Crow(Character):
                 })
                 
                 # second LLM call with observation results
-                final_response, _ = self._call_llm(
+                final_response, _ = await self._in_thread(
+                    self._call_llm,
                     messages=messages,
                     temperature=0.7,
                     max_tokens=200,
@@ -416,7 +416,7 @@ class Magpie(Character):
         """Generate a response."""
         if self.use_cloud:
             return await self._respond_cloud(message, history, user_key=user_key)
-        return self._respond_ollama(message, history)
+        return await self._in_thread(self._respond_ollama, message, history)
     
     def _respond_ollama(self, message: str, history: Optional[List[Dict]] = None) -> str:
         """Use Ollama."""
@@ -475,7 +475,8 @@ class Magpie(Character):
         tools = self._get_tool_definitions()
         
         # First LLM call
-        first_response, _ = self._call_llm(
+        first_response, _ = await self._in_thread(
+            self._call_llm,
             messages=messages,
             tools=tools,
             temperature=0.8,
@@ -540,7 +541,8 @@ class Magpie(Character):
                 })
                 
                 # Second LLM call with tool results
-                final_response, _ = self._call_llm(
+                final_response, _ = await self._in_thread(
+                    self._call_llm,
                     messages=messages,
                     temperature=0.8,
                     max_tokens=200,  # More tokens for synthesis
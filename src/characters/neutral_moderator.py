@@ -312,7 +312,8 @@ Focus on:
         
         messages.append({"role": "user", "content": message})
         
-        response, provider = self._call_llm(
+        response, provider = await self._in_thread(
+            self._call_llm,
             messages=messages,
             temperature=0.3,  # Lower temperature for consistency
             max_tokens=300,
@@ -423,7 +423,7 @@ class Raven(Character):
         """Generate a response."""
         if self.use_cloud:
             return await self._respond_cloud(message, history, user_key=user_key)
-        return self._respond_ollama(message, history)
+        return await self._in_thread(self._respond_ollama, message, history)
 
     async def _respond_cloud(self, message: str, history: Optional[List[Dict]] = None, user_key: Optional[str] = None) -> str:
         """Use cloud providers with tool calling for Raven's investigative workflow."""
@@ -437,7 +437,8 @@ class Raven(Character):
         tools = self._get_tool_definitions()
 
         # First LLM call - may trigger tool use
-        first_response, provider = self._call_llm(
+        first_response, provider = await self._in_thread(
+            self._call_llm,
             messages=messages,
             tools=tools,
             temperature=0.8,
@@ -480,7 +481,8 @@ class Raven(Character):
                 })
 
                 # Second LLM call with tool results
-                second_response, _ = self._call_llm(
+                second_response, _ = await self._in_thread(
+                    self._call_llm,
                     messages=messages,
                     temperature=0.8,
                     max_tokens=200,
@@ -1,13 +1,19 @@
-from typing import Dict, List
+from functools import cache
+from typing import Dict, List, Type
 from src.characters.base_character import Character 
 
 REGISTRY: Dict[str, Character] = {}
 
 def register_instance(character: Character) -> None:
     REGISTRY[character.name.lower()] = character
+
+@cache
+def shared_instance(cls: Type[Character]) -> Character:
+    """Build `cls` once per process; re-imports (e.g. gradio reload) reuse it."""
+    return cls()
     
 def get_character(name: str) -> Character | None:
     return REGISTRY.get(name.lower())
 
 def get_all_characters() -> List[Character]:
-    return list(REGISTRY.values())
\ No newline at end of file
+    return list(REGISTRY.values())
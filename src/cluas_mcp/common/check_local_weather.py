@@ -1,3 +1,4 @@
+import asyncio
 import httpx
 from typing import Dict, Optional, Any
 
@@ -103,7 +104,7 @@ async def check_weather(location: str) -> str:
 
 def check_local_weather_sync(location: str | None = None, character: Any = None) -> dict:
     """Sync wrapper for MCP executor."""
-    import asyncio
+    # a fresh loop per call: nothing outlives the call or leaks with the worker thread
     return asyncio.run(check_local_weather(location=location, character=character))
 
 
@@ -1,27 +1,45 @@
+import asyncio
 import logging
+import threading
+from urllib.parse import urlparse
 from duckduckgo_search import DDGS
+from duckduckgo_search.exceptions import RatelimitException
 
 logger = logging.getLogger(__name__)
 
+# DDG starts banning after ~5-6 rapid requests, so cap in-flight searches
+# across every caller (sync tool calls run in executor threads too).
+_DDG_SLOTS = threading.BoundedSemaphore(3)
+
+def _ddg_text(query: str) -> list:
+    with _DDG_SLOTS:
+        try:
+            with DDGS() as ddgs:
+                return list(ddgs.text(query, max_results=5))
+        except RatelimitException:
+            logger.warning("DDG rate limited, retrying with html backend")
+            with DDGS() as ddgs:
+                return list(ddgs.text(query, max_results=5, backend="html"))
+
 def explore_web(query: str) -> dict:
     """
     Search web using DuckDuckGo.
-    No API key needed, no rate limits.
+    No API key needed; concurrent searches are capped to stay under DDG's rate limit.
     """
     logger.info(f"Web search for: {query}")
     
     try:
-        with DDGS() as ddgs:
-            results_raw = list(ddgs.text(query, max_results=5))
+        results_raw = _ddg_text(query)
         
-        results = []
-        for item in results_raw:
-            results.append({
+        results = [
+            {
                 "title": item.get("title", "No title"),
                 "url": item.get("href", ""),
                 "snippet": item.get("body", ""),
-                "source": _extract_domain(item.get("href", ""))
-            })
+                "source": _extract_domain(item.get("href", "")),
+            }
+            for item in results_raw
+        ]
         
         return {
             "results": results,
@@ -33,11 +51,17 @@ def explore_web(query: str) -> dict:
         logger.error(f"Web search error: {e}")
         return _mock_explore_web(query)
 
+async def explore_web_async(query: str) -> dict:
+    """Non-blocking explore_web for use from async handlers."""
+    return await asyncio.to_thread(explore_web, query)
+
 def _extract_domain(url: str) -> str:
+    if not url:
+        return "unknown"
     try:
-        from urllib.parse import urlparse
         return urlparse(url).netloc or "unknown"
-    except:
+    except (ValueError, TypeError, AttributeError):
+        # malformed or non-string href: label this result, keep the rest
         return "unknown"
 
 def _mock_explore_web(query: str) -> dict:
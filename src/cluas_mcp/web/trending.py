@@ -122,24 +122,24 @@ async def explore_trend_angles(topic: str, location: Optional[str] = None, depth
     Returns:
         Dict with keys: trending, surface_drivers, narrative, local_angle (if location), criticism (if deep)
     """
-    from src.cluas_mcp.web.explore_web import explore_web
+    from src.cluas_mcp.web.explore_web import explore_web_async
     
     loop = asyncio.get_event_loop()
     
     # Build task list based on depth
     tasks = [
         loop.run_in_executor(None, lambda: get_trends(topic)),
-        loop.run_in_executor(None, lambda: explore_web(f"why {topic} trending 2025")),
+        explore_web_async(f"why {topic} trending 2025"),
     ]
     
     if depth in ["medium", "deep"]:
-        tasks.append(loop.run_in_executor(None, lambda: explore_web(f"{topic} cultural shift 2025")))
+        tasks.append(explore_web_async(f"{topic} cultural shift 2025"))
     
     if location:
-        tasks.append(loop.run_in_executor(None, lambda: explore_web(f"{topic} {location} 2025")))
+        tasks.append(explore_web_async(f"{topic} {location} 2025"))
     
     if depth == "deep":
-        tasks.append(loop.run_in_executor(None, lambda: explore_web(f"{topic} criticism problems 2025")))
+        tasks.append(explore_web_async(f"{topic} criticism problems 2025"))
     
     # Execute all tasks in parallel
     results = await asyncio.gather(*tasks, return_exceptions=True)
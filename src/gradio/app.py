@@ -1,14 +1,16 @@
 import gradio as gr
-import os
 import logging
 import asyncio
 import html
+import os
 import random
 import re
 import tempfile
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, AsyncIterator, Deque, Dict, List, Literal, Optional, Tuple
 from src.characters import (
     Corvus,
     Magpie,
@@ -17,10 +19,11 @@ from src.characters import (
     Moderator,
     Character,
     register_instance,
+    shared_instance,
     get_all_characters,
     REGISTRY,
 )
-from src.gradio.types import BaseMessage, UIMessage, to_llm_history, from_gradio_format
+from src.gradio.types import BaseMessage, PhaseTurn, UIMessage, to_llm_history, from_gradio_format
 from gradio.themes import Monochrome
 
 
@@ -32,18 +35,26 @@ TOOL_CALL_PATTERN = re.compile(r"function=(\w+)>(.*?)</function>", re.DOTALL)
 
 def sanitize_tool_calls(text: str) -> str:
     """Replace raw tool call markup with readable format."""
-    def _replace(match):
-        func = match.group(1)
-        payload = match.group(2)
-        return f"*Tool call · {func} {payload}*"
-    return TOOL_CALL_PATTERN.sub(_replace, text)
-
-# instantiate characters (as you already do)
-corvus = Corvus()
-magpie = Magpie()
-raven = Raven()
-crow = Crow()
-moderator_instance = Moderator()
+    # no closing tag, no match: skip the regex, whose lazy body would otherwise
+    # scan to the end of the text from every unclosed opener (common mid-stream)
+    if "</function>" not in text:
+        return text
+    return TOOL_CALL_PATTERN.sub(r"*Tool call · \1 \2*", text)
+
+def _escape_text(text: str) -> str:
+    """Escape text for an HTML element body (never an attribute value).
+
+    Quotes are harmless there, so skipping them saves two of html.escape's five
+    replace passes; str.translate with multi-char targets measured far slower.
+    """
+    return html.escape(text, quote=False)
+
+# instantiate characters once per process (clients are costly to build)
+corvus = shared_instance(Corvus)
+magpie = shared_instance(Magpie)
+raven = shared_instance(Raven)
+crow = shared_instance(Crow)
+moderator_instance = shared_instance(Moderator)
 
 # register them
 register_instance(corvus)
@@ -56,6 +67,18 @@ register_instance(crow)
 # then use
 CHARACTERS = get_all_characters()  # List[Character]
 
+# display name -> character
+_CHAR_BY_NAME: Dict[str, Character] = {char.name: char for char in CHARACTERS}
+
+# @mention lookup (lowercase -> display name), compiled once from the registry.
+# The pattern starts with the literal "@" (the start-of-word check comes after it)
+# so the regex engine can jump between "@"s instead of trying every position.
+_MENTION_LOOKUP: Dict[str, str] = {key: char.name for key, char in REGISTRY.items()}
+_MENTION_RE = re.compile(
+    r"@(?<!\S@)(" + "|".join(map(re.escape, _MENTION_LOOKUP)) + r")\b",
+    re.IGNORECASE,
+)
+
 
 #  debate phases:
 PHASE_INSTRUCTIONS = {
@@ -64,9 +87,71 @@ PHASE_INSTRUCTIONS = {
     "synthesis": "Integrate the best ideas so far. Resolve tensions and propose a balanced, actionable view.",
 }
 
+# gap between character launches within a deliberation phase
+CHARACTER_STAGGER_SECONDS = 1.0
+
+# process-wide cap on in-flight LLM calls, shared by every chat and deliberation;
+# set LLM_CONCURRENCY to match the provider's actual limit. A cancelled call keeps
+# its slot until its worker thread returns (Character._in_thread)
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("LLM_CONCURRENCY", "8"))
+_LLM_SLOTS = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+# sessions allowed to wait in the Gradio queue before new ones are turned away
+QUEUE_MAX_SIZE = 64
+
+# minimum gap between successive chat LLM calls
+CHAT_CALL_SPACING_SECONDS = 0.5
+
+# minimum gap between streamed chat frames (chunks arriving faster are batched)
+CHAT_RENDER_INTERVAL_SECONDS = 0.05
+
+# how many recent chat messages a character gets as context
+CHAT_CONTEXT_MESSAGES = 5
+
+# chat bubbles rendered outside the lazily-laid-out archive
+CHAT_LIVE_WINDOW = 20
+
+# chat bubbles sent to the browser per render ("Show earlier" sends them all)
+CHAT_RENDER_LIMIT = 60
+
+# in-character stand-ins for a failed or empty LLM reply
+ERROR_MESSAGES = {
+    "Corvus": "*pauses mid-thought, adjusting spectacles* I seem to have lost my train of thought...",
+    "Magpie": "*distracted by something shiny* Oh! Sorry, what were we talking about?",
+    "Raven": "Connection acting up again. Typical.",
+    "Crow": "*silent, gazing into the distance*"
+}
+
 # load CSS:
 CSS_PATH = Path(__file__).parent / "styles.css"
-CUSTOM_CSS = CSS_PATH.read_text() if CSS_PATH.exists() else ""
+try:
+    CUSTOM_CSS = CSS_PATH.read_text()
+except FileNotFoundError:
+    CUSTOM_CSS = ""
+
+# installed once per page load: keeps the chat pinned to the newest bubble
+# without shipping a <script> inside every streamed HTML update
+CHAT_AUTOSCROLL_JS = """
+() => {
+    const container = document.getElementById("chat-container");
+    if (!container) return;
+    // only follow new output while the reader is at (or near) the bottom; scroll
+    // events fire before content grows, so they record where the reader was
+    const NEAR_BOTTOM_PX = 48;
+    const detached = new WeakSet();
+    container.addEventListener("scroll", (event) => {
+        const el = event.target;
+        if (el.scrollHeight - el.scrollTop - el.clientHeight > NEAR_BOTTOM_PX) detached.add(el);
+        else detached.delete(el);
+    }, {capture: true, passive: true});
+    const pin = () => {
+        for (const el of [container, container.firstElementChild]) {
+            if (el && !detached.has(el)) el.scrollTop = el.scrollHeight;
+        }
+    };
+    new MutationObserver(pin).observe(container, {childList: true, subtree: true, characterData: true});
+}
+"""
 
 def clear_chat():
     """Clear the chat history."""
@@ -88,233 +173,390 @@ theme.set(
 
 
 
-def render_chat_html(history: List[Dict]) -> str:
-    """Render chat history to HTML (supports streaming)."""
-    html_parts = []
-    
-    for message in history:
-        role = message.get("role", "")
-        content = message.get("content", "")
-        name = message.get("name", "")
-        emoji = message.get("emoji", "")
-        is_typing = message.get("typing", False)
-        is_streaming = message.get("streaming", False)
-        
-        if role == "user":
-            html_parts.append(f'''
-                <div class="chat-message user">
-                    <div class="chat-content">
-                        <div class="chat-bubble">{html.escape(content)}</div>
-                    </div>
-                </div>
-            ''')
-        elif role == "assistant":
-            css_class = f"chat-message {name.lower()}"
-            if is_typing:
-                css_class += " typing"
-            elif is_streaming:
-                css_class += " streaming"
-            
-            html_parts.append(f'''
-                <div class="{css_class}">
-                    <div class="chat-avatar">{emoji}</div>
-                    <div class="chat-content">
-                        <div class="chat-name">{name}</div>
-                        <div class="chat-bubble">{html.escape(content)}</div>
-                    </div>
-                </div>
-            ''')
-    
-    return ''.join(html_parts)
+# bubbles are minified: indentation would ride along in every frame sent to the browser
+_USER_BUBBLE_HEAD = '<div class="chat-message user"><div class="chat-content"><div class="chat-bubble">'
+
+_CHAR_BUBBLE_HEAD_TMPL = (
+    '<div class="{css_class}"><div class="chat-avatar">{emoji}</div>'
+    '<div class="chat-content"><div class="chat-name">{name}</div><div class="chat-bubble">'
+)
+
+# closes .chat-bubble, .chat-content and .chat-message for both kinds of bubble
+_BUBBLE_TAIL = '</div></div></div>'
+
+_CHAT_EARLIER_TMPL = '<div class="chat-earlier">{count} earlier messages not shown</div>'
+
+_TYPING_DOTS_HTML = '<div class="typing-indicator"><span></span><span></span><span></span></div>'
+
+
+def _assistant_entry(
+    char: Character, content: str, content_html: Optional[str] = None, **state: bool
+) -> Dict[str, Any]:
+    """Chat history entry for a character; the bubble text is escaped once, here
+    (or by the caller, who passes `content_html`)."""
+    return {
+        "role": "assistant",
+        "content": content,
+        "content_html": _escape_text(content) if content_html is None else content_html,
+        "name": char.name,
+        "emoji": char.emoji,
+        **state,
+    }
+
+
+def _content_html(message: Dict) -> str:
+    # entries built by _assistant_entry carry their escaped text; anything else is escaped now
+    cached = message.get("content_html")
+    return cached if cached is not None else _escape_text(message.get("content", ""))
+
+
+@lru_cache(maxsize=64)
+def _char_bubble_head(name: str, emoji: str, state: str) -> str:
+    # everything before the bubble text depends only on the speaker and its state
+    return _CHAR_BUBBLE_HEAD_TMPL.format(
+        css_class=f"chat-message {name.lower()}{state}",
+        emoji=emoji,
+        name=name,
+    )
+
+
+def _render_chat_message(message: Dict) -> str:
+    role = message.get("role", "")
+    if role == "user":
+        return _USER_BUBBLE_HEAD + _content_html(message) + _BUBBLE_TAIL
+    if role != "assistant":
+        return ""
+
+    content = _content_html(message)
+    state = ""
+    if message.get("typing", False):
+        state = " typing"
+        # the dots animate client-side (CSS), so no server frames are spent on them
+        content += _TYPING_DOTS_HTML
+    elif message.get("streaming", False):
+        state = " streaming"
+
+    head = _char_bubble_head(message.get("name", ""), message.get("emoji", ""), state)
+    return head + content + _BUBBLE_TAIL
+
+
+def _render_chat_prefix(history: List[Dict], stop: int, limit: Optional[int] = CHAT_RENDER_LIMIT) -> str:
+    """Render `history[:stop]` exactly as it starts `render_chat_html(history, limit)`.
+
+    `stop` must not fall inside the archive (stop >= len(history) - CHAT_LIVE_WINDOW),
+    so the bubbles after it can simply be appended to the result.
+    """
+    start = max(len(history) - limit, 0) if limit else 0
+    cut = max(len(history) - CHAT_LIVE_WINDOW, start)
+    earlier_html = _CHAT_EARLIER_TMPL.format(count=start) if start else ""
+    live_html = "".join(_render_chat_message(message) for message in history[cut:stop])
+    if cut == start:
+        return earlier_html + live_html
+    archive_html = "".join(_render_chat_message(message) for message in history[start:cut])
+    return f'{earlier_html}<div class="chat-archive">{archive_html}</div>{live_html}'
+
+
+def _settled_until(history: List[Dict], stop: int) -> int:
+    """Index of the first rendered bubble before `stop` that is still typing or
+    streaming (another turn in progress on the same history), else `stop`."""
+    for index in range(max(len(history) - CHAT_RENDER_LIMIT, 0), stop):
+        message = history[index]
+        if message.get("typing", False) or message.get("streaming", False):
+            return index
+    return stop
+
+
+def render_chat_html(history: List[Dict], limit: Optional[int] = CHAT_RENDER_LIMIT) -> str:
+    """Render chat history to HTML (supports streaming).
+
+    Only the last `limit` bubbles are sent (None sends all); anything older is
+    summarised by a one-line stub. Of those, only the last CHAT_LIVE_WINDOW are
+    laid out eagerly; the rest go in a `.chat-archive` wrapper that the browser
+    skips until scrolled into view.
+    """
+    return _render_chat_prefix(history, len(history), limit)
 
 
 
 def parse_mentions(message: str) -> list[str] | None:
     """Extract @CharacterName mentions. Returns None if no mentions (all respond)."""
-    lookup = set(REGISTRY.keys())
-    
-    mentions = []
-    for word in message.split():
-        if not word.startswith("@"):
-            continue
-        name = word[1:].rstrip(".,!?;:").lower()
-        if name in lookup:
-            mentions.append(REGISTRY[name].name)
+    if "@" not in message:
+        return None
+    # dict.fromkeys: drop repeats ("@crow ... @Crow") but keep addressing order
+    mentions = list(dict.fromkeys(_MENTION_LOOKUP[name.lower()] for name in _MENTION_RE.findall(message)))
     return mentions or None
 
 
-def format_message(character: Character, message: str) -> Tuple[str, str]:
-    """Format message with character name and emoji"""
-    emoji = getattr(character, "emoji", "💬")
-    color = getattr(character, "color", "#121314")
-    name = getattr(character, "name", "counsel") 
-    
-    formatted = f'{emoji} <span style="color:{color}; font-weight:bold;">{name}</span>: {message}'
-    
-    return formatted, name
-
 async def get_character_response_stream(char: Character, message: str, llm_history: List[Dict], user_key: Optional[str] = None):
     """Stream character response in real-time chunks."""
     try:
         logger.debug(f"Streaming {char.name}.respond() with message: {message[:50]}...")
         
         # Get the streaming response from character
-        async for chunk in char.respond_stream(message, llm_history, user_key=user_key):
-            if chunk:
-                logger.debug(f"{char.name} streaming chunk: {chunk[:50]}...")
-                yield chunk
+        async with _LLM_SLOTS:
+            async for chunk in char.respond_stream(message, llm_history, user_key=user_key):
+                if chunk:
+                    logger.debug(f"{char.name} streaming chunk: {chunk[:50]}...")
+                    yield chunk
         
         logger.debug(f"{char.name} stream completed")
         
     except Exception as e:
         logger.error(f"{char.name} streaming error: {str(e)}")
         # Fallback response
-        error_messages = {
-            "Corvus": "*pauses mid-thought, adjusting spectacles* I seem to have lost my train of thought...",
-            "Magpie": "*distracted by something shiny* Oh! Sorry, what were we talking about?",
-            "Raven": "Connection acting up again. Typical.",
-            "Crow": "*silent, gazing into the distance*"
-        }
-        fallback = error_messages.get(char.name, f"*{char.name} seems distracted*")
-        yield fallback
+        yield _fallback_reply(char.name)
+
+
+def _fallback_reply(name: str) -> str:
+    return ERROR_MESSAGES.get(name, f"*{name} seems distracted*")
+
+
+class _SharedReply:
+    """An in-flight deliberation reply and how many callers still await it."""
+
+    __slots__ = ("task", "waiters")
 
-async def get_character_response(char: Character, message: str, llm_history: List[Dict], user_key: Optional[str] = None) -> str:
-    """Get response from a character; uses pre-formatted llm_history"""
+    def __init__(self, task: "asyncio.Task[str]"):
+        self.task = task
+        self.waiters = 0
+
+
+# identical self-contained prompts already in flight (double-clicked Deliberate,
+# retried API calls, same-seed runs) share one upstream call
+_inflight_replies: Dict[Tuple[str, str, Optional[str]], _SharedReply] = {}
+
+
+def _forget_reply(key: Tuple[str, str, Optional[str]], shared: _SharedReply) -> None:
+    # a cancelled call may still be winding down after a fresh one took its key
+    if _inflight_replies.get(key) is shared:
+        del _inflight_replies[key]
+
+
+async def get_character_reply(char: Character, prompt: str, user_key: Optional[str] = None) -> str:
+    """Answer a self-contained prompt with no chat history (deliberation calls).
+
+    Awaits Character.respond directly; no streaming scaffolding or chunk re-joining.
+    Concurrent calls with the same (character, prompt, key) await a single request,
+    which is cancelled once every one of them has gone away.
+    """
+    key = (char.name, prompt, user_key)
+    shared = _inflight_replies.get(key)
+    if shared is None:
+        shared = _inflight_replies[key] = _SharedReply(
+            asyncio.ensure_future(_fetch_character_reply(char, prompt, user_key))
+        )
+        shared.task.add_done_callback(lambda _: _forget_reply(key, shared))
+    shared.waiters += 1
     try:
-        logger.debug(f"Calling {char.name}.respond() with message: {message[:50]}...")
-        full_response = ""
-        async for chunk in get_character_response_stream(char, message, llm_history, user_key):
-            full_response += chunk
-        response = full_response
-        logger.debug(f"{char.name} responded with: {response[:100] if response else '<EMPTY>'}")
-        
-        if not response or not response.strip():
-            logger.warning(f"{char.name} returned empty response")
-            # Fallback response when LLM returns empty
-            error_messages = {
-                "Corvus": "*pauses mid-thought, adjusting spectacles* I seem to have lost my train of thought...",
-                "Magpie": "*distracted by something shiny* Oh! Sorry, what were we talking about?",
-                "Raven": "Connection acting up again. Typical.",
-                "Crow": "*silent, gazing into the distance*"
-            }
-            return error_messages.get(char.name, f"*{char.name} seems distracted*")
-            
-        return response
+        # shielded: one caller going away must not cancel the call for the others
+        return await asyncio.shield(shared.task)
+    finally:
+        shared.waiters -= 1
+        if not shared.waiters and not shared.task.done():
+            # nobody is left to read it: stop the call and free its LLM slot
+            _forget_reply(key, shared)
+            shared.task.cancel()
+
+
+async def _fetch_character_reply(char: Character, prompt: str, user_key: Optional[str]) -> str:
+    try:
+        async with _LLM_SLOTS:
+            response = await char.respond(prompt, [], user_key=user_key)
     except Exception as e:
         logger.error(f"{char.name} error: {str(e)}")
-        import traceback
-        logger.debug(f"Full traceback for {char.name}: {traceback.format_exc()}")
-        
-        # character-specific error messages
-        error_messages = {
-            "Corvus": "*pauses mid-thought, adjusting spectacles* Hmm, I seem to have lost my train of thought...",
-            "Magpie": "*distracted by something shiny* Oh! Sorry, what were we talking about?",
-            "Raven": "Internet being slow again. Typical.",
-            "Crow": "*silent, gazing into the distance*"
-        }
-        return error_messages.get(char.name, f"*{char.name} seems distracted*")
-        
+        response = ""
+
+    if not response or not response.strip():
+        logger.warning(f"{char.name} returned empty response")
+        return _fallback_reply(char.name)
+
+    return response
+
+
+class _ToolCallStream:
+    """A streamed reply, sanitised and escaped as it arrives.
+
+    Text that can no longer be part of a tool-call match is settled (sanitised and
+    escaped once); each chunk only redoes the unsettled tail - an unclosed
+    `function=...` call, or the last few characters that might start one. The
+    result always equals sanitize_tool_calls() over the whole reply.
+    """
+
+    __slots__ = ("_text", "_html", "_tail")
+
+    _OPENER = "function="
+    _CLOSER = "</function>"
+
+    def __init__(self):
+        self._text: List[str] = []
+        self._html: List[str] = []
+        self._tail = ""
+
+    def feed(self, chunk: str) -> None:
+        tail = self._tail + chunk
+        end = tail.rfind(self._CLOSER)
+        if end != -1:
+            end += len(self._CLOSER)
+            self._settle(sanitize_tool_calls(tail[:end]))
+            tail = tail[end:]
+        start = tail.find(self._OPENER)
+        if start == -1:
+            start = max(len(tail) - len(self._OPENER) + 1, 0)
+        if start:
+            self._settle(tail[:start])
+            tail = tail[start:]
+        self._tail = tail
+
+    def _settle(self, text: str) -> None:
+        self._text.append(text)
+        self._html.append(_escape_text(text))
+
+    def entry(self, char: Character, **state: bool) -> Dict[str, Any]:
+        tail = sanitize_tool_calls(self._tail)
+        return _assistant_entry(
+            char,
+            "".join(self._text) + tail,
+            "".join(self._html) + _escape_text(tail),
+            **state,
+        )
 
 
 async def chat_fn_stream(msg: str, history: List[Dict], user_key: Optional[str] = None):
     """Streaming chat function - yields updates in real-time."""
     if not msg or not msg.strip():
-        yield history
+        # nothing was added, so leave the rendered transcript as it is
+        yield gr.update()
         return
     
-    internal_history = [from_gradio_format(msg) for msg in history]
+    # Characters only see the last few turns, so only parse those - not the whole session
+    internal_history: Deque[BaseMessage] = deque(
+        (from_gradio_format(entry) for entry in history[-CHAT_CONTEXT_MESSAGES:]),
+        maxlen=CHAT_CONTEXT_MESSAGES,
+    )
     internal_history.append(BaseMessage(role="user", speaker="user", content=msg))
     
-    # Parse mentions
+    # Parse mentions; parse_mentions only returns registered names, and with
+    # no mentions the whole council answers
     mentioned_names = parse_mentions(msg)
-    if not mentioned_names:
-        mentioned_names = [char.name for char in CHARACTERS]
-    
-    # Get mentioned characters (case insensitive)
-    mentioned = []
-    for name in mentioned_names:
-        char = REGISTRY.get(name.lower())
-        if char:
-            mentioned.append(char)
-        else:
-            logger.warning(f"Character '{name}' not found in registry")
+    mentioned = (
+        [_CHAR_BY_NAME[name] for name in mentioned_names]
+        if mentioned_names
+        else CHARACTERS
+    )
     
     if not mentioned:
-        yield render_chat_html(history)
+        yield gr.update()
         return 
     
-    # Add typing indicators
-    typing_count = 0
-    for char in mentioned:
-        history.append({
-            "role": "assistant",
-            "content": f"*{char.name} is thinking...*",
-            "name": char.name,
-            "emoji": char.emoji,
-            "typing": True
-        })
-        typing_count += 1
-
-    yield render_chat_html(history)
-
-    # Remove typing indicators and add responses
-    for _ in range(typing_count):
-        history.pop()  # Remove last typing indicator
-    
+    # Add typing indicators; each one is replaced in place once its character answers
+    first_slot = len(history)
     for char in mentioned:
+        history.append(_assistant_entry(char, f"*{char.name} is thinking...*", typing=True))
+
+    # Settled bubbles never change again, so everything before the first unsettled
+    # one is rendered once; frames only redo this turn's replies and any bubbles of
+    # another turn still running on the same history
+    head_size = head_stop = 0
+    head_html: Optional[str] = None
+
+    def render_turn() -> str:
+        nonlocal head_size, head_stop, head_html
+        if len(history) != head_size:
+            # first frame, or another turn added bubbles and moved the window
+            head_size = len(history)
+            head_stop = _settled_until(history, first_slot)
+            head_html = (
+                _render_chat_prefix(history, head_stop)
+                if head_stop >= head_size - CHAT_LIVE_WINDOW
+                else None
+            )
+        if head_html is None:
+            return render_chat_html(history)
+        return head_html + "".join(_render_chat_message(message) for message in history[head_stop:])
+
+    # Everyone answers the same turn, so they share one history snapshot and
+    # run concurrently; each stream pushes (offset, final_entry_or_None) here
+    llm_history = to_llm_history(internal_history)
+    updates: asyncio.Queue = asyncio.Queue()
+    replies = [_ToolCallStream() for _ in mentioned]
+
+    async def stream_reply(offset: int, char: Character) -> None:
+        # stagger launches so request spacing to providers matches the old serial pause
+        await asyncio.sleep(offset * CHAT_CALL_SPACING_SECONDS)
+        reply = replies[offset]
         try:
-            llm_history = to_llm_history(internal_history[-5:])
-            await asyncio.sleep(0.5)  # Rate limiting delay
-            
-            # Stream response
-            response = ""
             async for chunk in get_character_response_stream(char, msg, llm_history, user_key):
-                response += chunk
-                # Update with partial response (sanitized)
-                sanitized_partial = sanitize_tool_calls(response)
-                history.append({
-                    "role": "assistant", 
-                    "content": sanitized_partial,
-                    "name": char.name,
-                    "emoji": char.emoji,
-                    "streaming": True
-                })
-                yield render_chat_html(history)
-                history.pop()  # Remove for next update
-            
-            # Sanitize and final response
-            sanitized_response = sanitize_tool_calls(response)
-            history.append({
-                "role": "assistant",
-                "content": sanitized_response,
-                "name": char.name,
-                "emoji": char.emoji
-            })
-            internal_history.append(BaseMessage(role="assistant", speaker=char.name, content=sanitized_response))
-            
+                reply.feed(chunk)
+                # just flag the change; the bubble is built once per frame, not per chunk
+                updates.put_nowait((offset, None))
+            entry = reply.entry(char)
         except Exception as e:
             logger.error(f"Error in chat_fn_stream for {char.name}: {e}")
-            history.append({
-                "role": "assistant",
-                "content": f"*{char.name} seems distracted*",
-                "name": char.name,
-                "emoji": char.emoji
-            })
+            entry = _assistant_entry(char, f"*{char.name} seems distracted*")
+        updates.put_nowait((offset, entry))
+
+    tasks = [
+        asyncio.create_task(stream_reply(offset, char))
+        for offset, char in enumerate(mentioned)
+    ]
+    loop = asyncio.get_running_loop()
+
+    try:
+        # typing frame renders while the requests are already in flight
+        yield render_turn()
+        last_render = loop.time()
+        remaining = len(tasks)
+        while remaining:
+            pending = [await updates.get()]
+            # mid-stream chunks wait out the rest of the render interval so a
+            # burst of them shares one frame; finished replies show at once
+            wait = last_render + CHAT_RENDER_INTERVAL_SECONDS - loop.time()
+            if wait > 0 and pending[0][1] is None:
+                await asyncio.sleep(wait)
+            # fold in every chunk that queued up meanwhile so the replies
+            # are re-rendered once per wake-up, not once per chunk
+            while not updates.empty():
+                pending.append(updates.get_nowait())
+            streaming = set()
+            for offset, entry in pending:
+                if entry is None:
+                    streaming.add(offset)
+                else:
+                    history[first_slot + offset] = entry
+                    streaming.discard(offset)
+                    remaining -= 1
+            for offset in streaming:
+                history[first_slot + offset] = replies[offset].entry(mentioned[offset], streaming=True)
+            if remaining:
+                yield render_turn()
+                last_render = loop.time()
+    finally:
+        # client went away mid-turn: stop the remaining LLM calls
+        for task in tasks:
+            task.cancel()
     
-    yield render_chat_html(history)  # Final result
+    yield render_turn()  # Final result
 
 
 async def chat_fn(msg: str, history: List[Dict], user_key: Optional[str] = None) -> str:
     """Non-streaming chat function that returns HTML."""
     result = []
     async for html_update in chat_fn_stream(msg, history, user_key):
-        result.append(html_update)
+        # no-change updates carry no HTML
+        if isinstance(html_update, str):
+            result.append(html_update)
     return result[-1] if result else render_chat_html(history)
 
 
 
-def _phase_instruction(phase: str) -> str:
-    return PHASE_INSTRUCTIONS.get(phase, "")
+@lru_cache(maxsize=64)
+def _phase_prompt_prefix(name: str, role: str, location: str, tone: str, phase: str) -> str:
+    # persona + phase header only depends on (character, phase): a dozen variants per run
+    return (
+        f"You are {name}, {role} based in {location}. {tone}\n"
+        f"PHASE: {phase.upper()}.\n"
+        f"INSTRUCTION: {PHASE_INSTRUCTIONS.get(phase, '')}\n\n"
+    )
 
 def _build_phase_prompt(
     *,
@@ -324,26 +566,35 @@ def _build_phase_prompt(
     history_snippet: str,
 ) -> str:
     
-    role = char.role
-    tone = char.tone
-    location = char.location
-    phase_text = _phase_instruction(phase)
+    prefix = _phase_prompt_prefix(char.name, char.role, char.location, char.tone, phase)
     history_block = history_snippet or "No prior discussion yet."
 
     return (
-        f"You are {char.name}, {role} based in {location}. {tone}\n"
-        f"PHASE: {phase.upper()}.\n"
-        f"INSTRUCTION: {phase_text}\n\n"
+        f"{prefix}"
         f"QUESTION / CONTEXT:\n{question}\n\n"
         f"RECENT COUNCIL NOTES:\n{history_block}\n\n"
         "Respond as a chat message (2-4 sentences is enough)."
     )
 
 
-def _history_text(history: List[str], limit: int = 13) -> str:
-    if not history:
-        return ""
-    return "\n".join(history[-limit:])
+class _RollingExcerpt:
+    """Last `limit` transcript lines, re-joined only after new lines arrive."""
+
+    __slots__ = ("_lines", "_text")
+
+    def __init__(self, limit: int = 13):
+        self._lines: Deque[str] = deque(maxlen=limit)
+        self._text: Optional[str] = ""
+
+    def append(self, line: str) -> None:
+        self._lines.append(line)
+        self._text = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self._lines)
+        return self._text
 
 
 async def _neutral_summary(history_text: str, moderator: Character = None, user_key: Optional[str] = None) -> str:
@@ -357,7 +608,7 @@ async def _neutral_summary(history_text: str, moderator: Character = None, user_
         "Summarize the key points, agreements, and disagreements succinctly..\n\n"
         f"TRANSCRIPT:\n{history_text}"
     )
-    return await get_character_response(moderator, prompt, [], user_key=user_key)
+    return await get_character_reply(moderator, prompt, user_key=user_key)
 
 async def _summarize_cycle(history_text: str, moderator: Character = None, user_key: Optional[str] = None) -> str:
     
@@ -369,21 +620,28 @@ async def _summarize_cycle(history_text: str, moderator: Character = None, user_
         "and synthesis highlights from the transcript below.\n\n"
         f"{history_text}"
     )
-    return await get_character_response(moderator, prompt, [], user_key=user_key)
+    return await get_character_reply(moderator, prompt, user_key=user_key)
 
 
 
-def to_html(message: UIMessage) -> str:
-    return f"""
-    <div class="chat-message {message.speaker}">
-        <div class="chat-avatar">{message.emoji}</div>
+_UI_MESSAGE_TMPL = """
+    <div class="chat-message {speaker}">
+        <div class="chat-avatar">{emoji}</div>
         <div class="chat-content">
-            <div class="chat-bubble">{html.escape(message.content)}</div>
+            <div class="chat-bubble">{content}</div>
         </div>
     </div>
     """
 
-async def deliberate(
+
+def to_html(message: UIMessage) -> str:
+    return _UI_MESSAGE_TMPL.format(
+        speaker=message.speaker,
+        emoji=message.emoji,
+        content=_escape_text(message.content),
+    )
+
+async def deliberate_stream(
     question: str,
     rounds: int = 1,
     summariser: str = "moderator",
@@ -391,20 +649,12 @@ async def deliberate(
     structure: Literal["nested", "flat"] = "nested",
     seed: Optional[int] = None,
     user_key: Optional[str] = None,
-) -> Dict[str, Any]:
-    """
-    Run a dialectic deliberation (thesis → antithesis → synthesis) with the council.
+) -> AsyncIterator[Tuple[List[PhaseTurn], Optional[Dict[str, Any]]]]:
+    """Run a deliberation, yielding `(records, result)` as it progresses.
 
-    Args:
-        question: Topic to deliberate on.
-        rounds: Number of full cycles (thesis/antithesis/synthesis). Each cycle deepens the analysis.
-        summariser: "moderator" for neutral summary or one of the characters ("Corvus", ...).
-        format: "llm" returns plain text history, "chat" returns display-ready HTML snippets.
-        structure: "nested" groups responses by phase, "flat" returns a chronological list.
-        seed: Optional seed to reproduce character ordering.
-
-    Returns:
-        Structured dict containing per-phase responses, cycle summaries, and final outcome.
+    `records` is the chronological list of PhaseTurns so far (the same list
+    object each time - read it, don't keep or mutate it). `result` is None after
+    each phase and the full `deliberate()` result on the final yield.
     """
     question = question.strip()
     if not question:
@@ -421,86 +671,64 @@ async def deliberate(
     order_names = [char.name for char in char_order]
 
     conversation_llm: List[str] = []
-    chat_history: List[Dict[str, Any]] = []
-    phase_records: Dict[str, List[Dict[str, Any]]] = {
-        "thesis": [],
-        "antithesis": [],
-        "synthesis": [],
-    }
-    flattened_records: List[Dict[str, Any]] = []
+    recent_notes = _RollingExcerpt()  # what each phase prompt sees
+    recap_notes = _RollingExcerpt(limit=36)  # what each cycle recap sees
+    records: List[PhaseTurn] = []
     cycle_summaries: List[Dict[str, Any]] = []
 
-    async def run_phase(phase: str, base_context: str, cycle_idx: int) -> List[Dict[str, Any]]:
-        history_excerpt = _history_text(conversation_llm)
-        entries: List[Dict[str, Any]] = []
-        
-        for char in char_order:
-            prompt = _build_phase_prompt(
+    async def respond_in_phase(phase: str, char: Character, prompt: str, slot: int) -> str:
+        # stagger launches so request spacing to providers matches the old serial pause
+        await asyncio.sleep(slot * CHARACTER_STAGGER_SECONDS)
+        try:
+            response = await get_character_reply(char, prompt, user_key=user_key)
+            text = sanitize_tool_calls(response.strip())
+            logger.debug("Phase %s: %s response: '%s'", phase, char.name, text[:100] if text else "<EMPTY>")
+        except Exception as e:
+            logger.error("Phase %s: %s failed (%s)", phase, char.name, e)
+            text = f"*{char.name} could not respond.*"
+        return text
+
+    async def run_phase(phase: str, base_context: str, cycle_idx: int) -> None:
+        # every character in a phase sees the same notes, so they can answer concurrently
+        history_excerpt = recent_notes.text
+        launched: List[Tuple[Character, str, asyncio.Task]] = []
+
+        async with asyncio.TaskGroup() as tg:
+            # each task is scheduled as soon as its prompt exists
+            for slot, char in enumerate(char_order):
+                prompt = _build_phase_prompt(
+                    phase=phase,
+                    char=char,
+                    question=base_context,
+                    history_snippet=history_excerpt,
+                )
+                launched.append((char, prompt, tg.create_task(respond_in_phase(phase, char, prompt, slot))))
+
+        # record in speaking order so seeded runs stay reproducible
+        for char, prompt, task in launched:
+            text = task.result()
+            line = f"[{phase.upper()} | Cycle {cycle_idx + 1}] {char.name}: {text}"
+            conversation_llm.append(line)
+            recent_notes.append(line)
+            recap_notes.append(line)
+            records.append(PhaseTurn(
+                cycle=cycle_idx + 1,
                 phase=phase,
+                name=char.name,
+                content=text,
+                content_html=_escape_text(text),
                 char=char,
-                question=base_context,
-                history_snippet=history_excerpt,
-            )
-            
-            try:
-                response = await get_character_response(char, prompt, [], user_key=user_key)
-                text = sanitize_tool_calls(response.strip())
-                logger.debug("Phase %s: %s response: '%s'", phase, char.name, text[:100] if text else "<EMPTY>")
-            except Exception as e:
-                logger.error("Phase %s: %s failed (%s)", phase, char.name, e)
-                text = f"*{char.name} could not respond.*"
-
-            conversation_llm.append(f"[{phase.upper()} | Cycle {cycle_idx + 1}] {char.name}: {text}")
-            # Don't escape here - format_message will handle HTML properly
-            formatted, _ = format_message(char, text)
-            chat_entry = {
-                "role": "assistant",
-                "content": [{"type": "text", "text": formatted}]
-            }
-            chat_history.append(chat_entry)
-            
-            entry = {
-                "cycle": cycle_idx + 1,
-                "phase": phase,
-                "name": char.name,
-                "content": text,
-                "char": char, 
-                "prompt": prompt,
-            }
-            
-            phase_records[phase].append(entry)
-            flattened_records.append(entry)
-            entries.append(entry)
-            
-            await asyncio.sleep(1.0)  # Pause between characters
-
-        return entries
+                prompt=prompt,
+            ))
 
-    cycle_context = question
-
-    for cycle_idx in range(rounds):
-        thesis_entries = await run_phase("thesis", cycle_context, cycle_idx)
-        antithesis_entries = await run_phase("antithesis", cycle_context, cycle_idx)
-        synthesis_entries = await run_phase("synthesis", cycle_context, cycle_idx)
-
-        cycle_text = _history_text(conversation_llm, limit=36)
-        summary_text = await _summarize_cycle(cycle_text, user_key=user_key)
-        cycle_summaries.append({
-            "cycle": cycle_idx + 1,
-            "summary": summary_text,
-        })
-        cycle_context = f"{question}\n\nPrevious cycle summary:\n{summary_text}"
-
-    full_history_text = "\n".join(conversation_llm)
     summariser_normalized = summariser.strip().lower()
+    selected: Optional[Character] = None
 
     if summariser_normalized == "moderator":
         logger.info("Using moderator for final summary")
-        final_summary = await _neutral_summary(full_history_text, user_key=user_key)
         summary_author = "Moderator"
     else:
-        name_map = {char.name.lower(): char for char in CHARACTERS}
-        selected = name_map.get(summariser_normalized)
+        selected = REGISTRY.get(summariser_normalized)
         if not selected:
             logger.warning(f"Summariser '{summariser}' not found in characters; falling back to moderator")
             selected = moderator_instance
@@ -511,32 +739,65 @@ async def deliberate(
         
         if selected is None:
             raise RuntimeError(f"Failed to resolve summariser: '{summariser}' and moderator unavailable")
-        
+
+    async def write_final_summary(full_history_text: str) -> str:
+        if selected is None:
+            return await _neutral_summary(full_history_text, user_key=user_key)
         summary_prompt = (
             "Provide a concise synthesis (3 sentences max) from your perspective, referencing the discussion below.\n\n"
             f"{full_history_text}"
         )
-        final_summary = await get_character_response(selected, summary_prompt, [], user_key=user_key)
+        return await get_character_reply(selected, summary_prompt, user_key=user_key)
 
-    if format == "chat":
-        # Use proper HTML formatting for chat format
-        if structure == "nested":
-            history_output = format_deliberation_html(phase_records)
-        else:
-            history_output = format_deliberation_html(flattened_records)
-    else:
-        # LLM format returns plain text
-        if structure == "nested":
-            history_output = phase_records
+    cycle_context = question
+    final_summary = ""
+
+    for cycle_idx in range(rounds):
+        for phase in PHASE_INSTRUCTIONS:
+            await run_phase(phase, cycle_context, cycle_idx)
+            yield records, None
+
+        cycle_text = recap_notes.text
+        if cycle_idx < rounds - 1:
+            summary_text = await _summarize_cycle(cycle_text, user_key=user_key)
         else:
-            history_output = flattened_records
+            # the final summary reads the whole transcript, not the last recap,
+            # so both can be written at the same time
+            async with asyncio.TaskGroup() as tg:
+                recap_task = tg.create_task(_summarize_cycle(cycle_text, user_key=user_key))
+                final_task = tg.create_task(write_final_summary("\n".join(conversation_llm)))
+            summary_text = recap_task.result()
+            final_summary = final_task.result()
+        cycle_summaries.append({
+            "cycle": cycle_idx + 1,
+            "summary": summary_text,
+        })
+        cycle_context = f"{question}\n\nPrevious cycle summary:\n{summary_text}"
 
+    # turns become plain dicts only here, for the returned result
     if structure == "nested":
-        phase_output: Dict[str, Any] = phase_records
+        by_phase: Dict[str, List[PhaseTurn]] = {phase: [] for phase in PHASE_INSTRUCTIONS}
+        for turn in records:
+            by_phase[turn.phase].append(turn)
+        ordered = [turn for turns in by_phase.values() for turn in turns]
+        phase_output: Dict[str, Any] = {
+            phase: [turn.to_dict() for turn in turns] for phase, turns in by_phase.items()
+        }
     else:
-        phase_output = flattened_records
+        ordered = records
+        phase_output = [turn.to_dict() for turn in records]
 
-    return {
+    if format == "chat":
+        # Use proper HTML formatting for chat format; rendered from the turns,
+        # whose text is already escaped
+        history_output = _DELIB_CONTAINER_TMPL.format(
+            entries="".join(_render_phase_turn(turn) for turn in ordered)
+        )
+    else:
+        # LLM format returns plain text
+        history_output = phase_output
+
+    yield records, {
         "question": question,
         "rounds": rounds,
         "seed": seed,
@@ -553,34 +814,76 @@ async def deliberate(
     }
 
 
+async def deliberate(
+    question: str,
+    rounds: int = 1,
+    summariser: str = "moderator",
+    format: Literal["llm", "chat"] = "llm",
+    structure: Literal["nested", "flat"] = "nested",
+    seed: Optional[int] = None,
+    user_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run a dialectic deliberation (thesis → antithesis → synthesis) with the council.
+
+    Args:
+        question: Topic to deliberate on.
+        rounds: Number of full cycles (thesis/antithesis/synthesis). Each cycle deepens the analysis.
+        summariser: "moderator" for neutral summary or one of the characters ("Corvus", ...).
+        format: "llm" returns plain text history, "chat" returns display-ready HTML snippets.
+        structure: "nested" groups responses by phase, "flat" returns a chronological list.
+        seed: Optional seed to reproduce character ordering.
+
+    Returns:
+        Structured dict containing per-phase responses, cycle summaries, and final outcome.
+    """
+    async for _, result in deliberate_stream(
+        question, rounds, summariser, format, structure, seed, user_key
+    ):
+        pass
+    return result
+
+
+def _write_transcript(text: str, prefix: str = "cluas_huginn_") -> str:
+    """Write a transcript to a new temp .txt file and return its path (blocking)."""
+    with tempfile.NamedTemporaryFile(
+        mode="w", delete=False, suffix=".txt", prefix=prefix, encoding="utf-8"
+    ) as tmp_file:
+        tmp_file.write(text)
+    return tmp_file.name
+
+
 async def run_deliberation_and_export(question, rounds, summariser, user_key: Optional[str] = None):
-    """Run the deliberation AND produce a downloadable .txt file."""
+    """Run the deliberation, showing each phase as it lands, AND produce a downloadable .txt file."""
     
     if not question or question.strip() == "":
-        return "<p>Please enter a question.</p>", None
+        yield "<p>Please enter a question.</p>", None
+        return
 
     try:
         # run deliberation
-        result = await deliberate(
+        rendered: List[str] = []
+        async for records, result in deliberate_stream(
             question, 
             rounds=rounds, 
             summariser=summariser,
             format="llm",  # to ensure it actually gets text format
             structure="flat",
             user_key=user_key
-        )
+        ):
+            # only the entries added by the latest phase need rendering
+            rendered.extend(_render_phase_turn(turn) for turn in records[len(rendered):])
+            if result is None:
+                yield _DELIB_CONTAINER_TMPL.format(entries="".join(rendered)), None
         
-        # Create temp file for download with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', prefix=f'cluas_huginn_{timestamp}_') as f:
-            # format html for display
-            display_html = format_deliberation_html(result["phases"])
-            display_html += f'''
-                <div class="delib-summary">
-                    <h3>Final Summary ({result['final_summary']['by']})</h3>
-                    <p>{html.escape(result['final_summary']['content'])}</p>
-                </div>
-            '''
+        # format html for display
+        display_html = "".join((
+            _DELIB_CONTAINER_TMPL.format(entries="".join(rendered)),
+            _DELIB_SUMMARY_TMPL.format(
+                by=result["final_summary"]["by"],
+                content=_escape_text(result["final_summary"]["content"]),
+            ),
+        ))
         
         # Handle different history formats
         history = result["history"]
@@ -610,13 +913,6 @@ async def run_deliberation_and_export(question, rounds, summariser, user_key: Op
             text_content = str(history)
         
         
-        # the code below could be it's own function, 
-        # but it's not reused atm, so that seems wasteful.
-        # worth keeping in mind for future use, tho.
-        
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".txt")
-        os.close(tmp_fd)
-        
         header = (
                 f"Question: {question}\n"
                 f"Rounds: {rounds}\n"
@@ -631,16 +927,69 @@ async def run_deliberation_and_export(question, rounds, summariser, user_key: Op
                 f"{result['final_summary']['content']}"
             )
     
-        with open(tmp_path, "w", encoding="utf-8") as tmp_file:
-            tmp_file.write(header)
-            tmp_file.write(text_content)
-            tmp_file.write(footer)
+        # disk I/O runs in a worker thread so other sessions keep being served
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        tmp_path = await asyncio.to_thread(
+            _write_transcript,
+            "".join((header, text_content, footer)),
+            f"cluas_huginn_{timestamp}_",
+        )
             
-        return display_html, tmp_path
+        yield display_html, tmp_path
         
     except Exception as e:
         logger.error(f"Deliberation error: {e}", exc_info=True)
-        return f"<p style='color: red;'>Error: {str(e)}</p>", None
+        yield f"<p style='color: red;'>Error: {str(e)}</p>", None
+
+
+_DELIB_ENTRY_TMPL = '''
+                <div class="delib-message {phase} {name_class}">
+                    <div class="delib-header">
+                        <span class="delib-phase">{phase_label}</span>
+                        <span class="delib-cycle">Cycle {cycle}</span>
+                    </div>
+                    <div class="delib-speaker">{emoji} {name}</div>
+                    <div class="delib-content">{content}</div>
+                </div>
+            '''
+
+
+_DELIB_CONTAINER_TMPL = '<div class="deliberation-container">{entries}</div>'
+
+
+_DELIB_SUMMARY_TMPL = '''
+                <div class="delib-summary">
+                    <h3>Final Summary ({by})</h3>
+                    <p>{content}</p>
+                </div>
+            '''
+
+
+def _format_delib_entry(phase: str, name: str, cycle: int, char: Any, content_html: str) -> str:
+    phase = phase.lower()
+    return _DELIB_ENTRY_TMPL.format(
+        phase=phase,
+        name_class=name.lower(),
+        phase_label=phase.capitalize(),
+        cycle=cycle,
+        emoji=getattr(char, "emoji", "💬") if char else "💬",
+        name=name,
+        content=content_html,
+    )
+
+
+def _render_phase_turn(turn: PhaseTurn) -> str:
+    return _format_delib_entry(turn.phase, turn.name, turn.cycle, turn.char, turn.content_html)
+
+
+def _render_delib_entry(entry: Dict[str, Any]) -> str:
+    return _format_delib_entry(
+        entry.get("phase", "unknown"),
+        entry.get("name", "unknown"),
+        entry.get("cycle", 0),
+        entry.get("char"),
+        _content_html(entry),
+    )
 
 
 def format_deliberation_html(entries: list | dict) -> str:
@@ -654,30 +1003,9 @@ def format_deliberation_html(entries: list | dict) -> str:
     if isinstance(entries, dict):
         entries = [e for phase_list in entries.values() for e in phase_list]
     
-    html_parts = ['<div class="deliberation-container">']
-    
-    for entry in entries:#
-        phase = entry.get("phase", "unknown").lower()
-        cycle = entry.get("cycle", 0)
-        name = entry.get("name", "unknown")
-        content = entry.get("content", "")
-        char = entry.get("char")
-        emoji = getattr(char, "emoji", "💬") if char else "💬"
-        
-        
-        html_parts.append(f'''
-                <div class="delib-message {phase} {name.lower()}">
-                    <div class="delib-header">
-                        <span class="delib-phase">{phase.capitalize()}</span>
-                        <span class="delib-cycle">Cycle {cycle}</span>
-                    </div>
-                    <div class="delib-speaker">{emoji} {name}</div>
-                    <div class="delib-content">{html.escape(content)}</div>
-                </div>
-            ''')
-    
-    html_parts.append('</div>')
-    return ''.join(html_parts)
+    return _DELIB_CONTAINER_TMPL.format(
+        entries="".join(_render_delib_entry(entry) for entry in entries)
+    )
 
 
 # Create Gradio interface
@@ -699,14 +1027,6 @@ with gr.Blocks(title="Cluas Huginn") as demo:
         with gr.Tab("Chat"):
             gr.Markdown("**Chat Mode:** Talk directly with the council. Use @CharacterName to address specific members.")
 
-            # Load avatars dynamically from folder
-            avatar_folder = Path("avatars")
-            
-            avatar_images = [
-                str(avatar_folder / f"{char.name.lower()}.png") 
-                for char in CHARACTERS
-            ]
-
             # Chatbot state
             chat_state = gr.State([])
 
@@ -736,7 +1056,9 @@ with gr.Blocks(title="Cluas Huginn") as demo:
                 with gr.Column(scale=3, min_width=600, elem_classes=["chat-output-col"]):
                     chat_html = gr.HTML(elem_id="chat-container", interactive=True)
                     gr.Markdown(" ")  # Small spacer
-                    clear_btn = gr.Button("Clear Chat", variant="secondary", elem_classes=["chat-btn"])
+                    with gr.Row():
+                        earlier_btn = gr.Button("Show Earlier Messages", variant="secondary", elem_classes=["chat-btn"])
+                        clear_btn = gr.Button("Clear Chat", variant="secondary", elem_classes=["chat-btn"])
 
             # API Key input (separated with spacing) - kept outside the main row
             gr.HTML("<div style='margin-top: 20px;'></div>")  # Spacer
@@ -748,13 +1070,22 @@ with gr.Blocks(title="Cluas Huginn") as demo:
                     container=True,
                 )
 
-            # Handle submit with streaming
-            msg.submit(chat_fn, [msg, chat_state, user_key], [chat_html], queue=True)\
-                .then(lambda: "", None, [msg])
-
-            submit_btn.click(chat_fn, [msg, chat_state, user_key], [chat_html], queue=True)\
-                .then(lambda: "", None, [msg])
+            # Handle submit with streaming: each partial render is pushed as it arrives.
+            # Enter and Send are one event, and trigger_mode="once" drops a submit while
+            # this session's previous turn is still streaming, so turns never overlap
+            # on the shared chat_state (other sessions still run concurrently)
+            gr.on(
+                [msg.submit, submit_btn.click],
+                chat_fn_stream,
+                [msg, chat_state, user_key],
+                [chat_html],
+                queue=True,
+                trigger_mode="once",
+            ).then(lambda: "", None, [msg])
             
+            # one-off full render; the next turn goes back to the recent window
+            earlier_btn.click(lambda history: render_chat_html(history, limit=None), [chat_state], [chat_html])
+
             clear_btn.click(clear_chat, outputs=[chat_state, chat_html])\
                 .then(lambda: "", None, [msg])
                 
@@ -828,11 +1159,18 @@ with gr.Blocks(title="Cluas Huginn") as demo:
     </p>
     """)
 
+    demo.load(None, js=CHAT_AUTOSCROLL_JS)
+
     gr.api(
         deliberate,
         api_name="deliberate",
     )
 
+# handlers only await network I/O, so sessions can share the loop; the LLM
+# semaphore, not the queue, is what bounds upstream load. The limit is per event
+# across sessions; a single session can't overlap its own chat turns, since the
+# chat trigger uses trigger_mode="once"
+demo.queue(default_concurrency_limit=MAX_CONCURRENT_LLM_CALLS, max_size=QUEUE_MAX_SIZE)
 
 # Export for app.py
 my_gradio_app = demo
@@ -852,5 +1190,4 @@ if __name__ == "__main__":
     # Minimal fix for loading_status undefined error
     demo.load(js="window.loading_status = window.loading_status || {};")
     
-    demo.queue()
     demo.launch(theme=theme, css=CUSTOM_CSS)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Literal, List, Dict
+from typing import Any, Literal, List, Dict
 from dataclasses import dataclass
 from src.characters import REGISTRY
 
@@ -42,6 +42,28 @@ class UIMessage(BaseMessage):
             turn_index=turn_index
         )
 
+@dataclass(slots=True)
+class PhaseTurn:
+    """One character's contribution to a deliberation phase"""
+    cycle: int
+    phase: str
+    name: str
+    content: str
+    content_html: str  # `content`, escaped once for HTML display
+    char: Any
+    prompt: str
+
+    def to_dict(self) -> Dict:
+        """Convert to the dict shape returned by deliberate() (content_html stays internal)"""
+        return {
+            "cycle": self.cycle,
+            "phase": self.phase,
+            "name": self.name,
+            "content": self.content,
+            "char": self.char,
+            "prompt": self.prompt,
+        }
+
 # Utility functions
 def to_llm_history(messages: List[BaseMessage]) -> List[Dict]:
     """Convert message list to LLM API format"""
@@ -1,7 +1,7 @@
 import pytest
 import asyncio
 import logging
-from src.gradio.app import chat_fn, parse_mentions
+from src.gradio.app import chat_fn, parse_mentions, render_chat_html
 from src.characters.registry import REGISTRY
 from src.gradio.types import BaseMessage, from_gradio_format, to_gradio_history
 
@@ -147,6 +147,98 @@ def test_parse_mentions_function():
     
     print("Parse mentions function tests passed")
 
+def test_parse_mentions_needs_word_start():
+    """@ must start a word and the name must end one"""
+    assert parse_mentions("mail me at someone@crow.net") is None
+    assert parse_mentions("@@crow or @Crowd?") is None
+    assert parse_mentions("\t@MAGPIE\n@raven,@corvus") == ["Magpie", "Raven"]
+
+def test_parse_mentions_deduplicates_in_order():
+    """Repeated mentions should only make a character answer once"""
+    assert parse_mentions("@raven @crow what say you, @Raven?") == ["Raven", "Crow"]
+
+def test_render_chat_html_escapes_and_marks_state():
+    """Test render_chat_html escapes content and tags typing/streaming bubbles"""
+    history = [
+        {"role": "user", "content": "<b>hi</b>"},
+        {"role": "assistant", "content": "a & b", "name": "Corvus", "emoji": "🐦‍⬛", "typing": True},
+        {"role": "assistant", "content": "partial", "name": "Raven", "emoji": "🐦", "streaming": True},
+        {"role": "system", "content": "ignored"},
+    ]
+    rendered = render_chat_html(history)
+
+    assert "&lt;b&gt;hi&lt;/b&gt;" in rendered
+    assert "a &amp; b" in rendered
+    assert 'class="chat-message corvus typing"' in rendered
+    assert 'class="chat-message raven streaming"' in rendered
+    assert "ignored" not in rendered
+    assert render_chat_html([]) == ""
+
+
+def test_render_chat_html_archives_old_bubbles():
+    """Test only the last CHAT_LIVE_WINDOW bubbles render outside the archive"""
+    from src.gradio.app import CHAT_LIVE_WINDOW
+
+    history = [{"role": "user", "content": f"msg {i}"} for i in range(CHAT_LIVE_WINDOW + 3)]
+    rendered = render_chat_html(history)
+
+    assert rendered == (
+        '<div class="chat-archive">'
+        + render_chat_html(history[:3])
+        + "</div>"
+        + render_chat_html(history[3:])
+    )
+    assert "chat-archive" not in render_chat_html(history[:CHAT_LIVE_WINDOW])
+
+def test_render_chat_prefix_plus_tail_matches_full_render():
+    """Streaming frames reuse a once-rendered prefix; it must line up with a full render"""
+    from src.gradio.app import CHAT_LIVE_WINDOW, _render_chat_prefix, _render_chat_message
+
+    for size in (3, CHAT_LIVE_WINDOW, CHAT_LIVE_WINDOW + 5):
+        history = [{"role": "user", "content": f"msg {i}"} for i in range(size)]
+        stop = size - 2
+        tail = "".join(_render_chat_message(message) for message in history[stop:])
+        assert _render_chat_prefix(history, stop) + tail == render_chat_html(history)
+
+@pytest.mark.asyncio
+async def test_overlapping_turns_do_not_freeze_each_others_bubbles(monkeypatch):
+    """A turn started while another still streams must keep re-rendering that turn's bubbles"""
+    from src.gradio import app
+
+    async def fake_stream(char, message, llm_history, user_key=None):
+        for word in (message, "done"):
+            await asyncio.sleep(0.001)
+            yield f"{char.name} {word} "
+
+    monkeypatch.setattr(app, "get_character_response_stream", fake_stream)
+    monkeypatch.setattr(app, "CHAT_CALL_SPACING_SECONDS", 0)
+
+    history = []
+    first = app.chat_fn_stream("first", history)
+    second = app.chat_fn_stream("second", history)
+    assert "is thinking" in await first.__anext__()
+    await second.__anext__()  # second turn starts while the first is still typing
+
+    first_frames = [frame async for frame in first]
+    second_frames = [frame async for frame in second]
+
+    assert "is thinking" not in second_frames[-1]
+    assert second_frames[-1] == render_chat_html(history)
+    assert first_frames
+
+def test_render_chat_html_windows_long_sessions():
+    """Only the last CHAT_RENDER_LIMIT bubbles are sent unless asked for all"""
+    from src.gradio.app import CHAT_RENDER_LIMIT
+
+    history = [{"role": "user", "content": f"msg {i}"} for i in range(CHAT_RENDER_LIMIT + 7)]
+    windowed = render_chat_html(history)
+    assert 'class="chat-earlier">7 earlier messages' in windowed
+    assert "msg 6<" not in windowed and "msg 7<" in windowed
+
+    full = render_chat_html(history, limit=None)
+    assert "chat-earlier" not in full
+    assert "msg 0<" in full
+
 def test_message_formatting_roundtrip():
     """Test message formatting utilities for chat"""
     # Test Gradio format roundtrip
@@ -196,4 +288,19 @@ async def test_chat_with_history_context(caplog):
         # Should have previous history + new messages
         assert len(final_history) > len(history), "Should have new messages added to history"
         
-        print(f"Chat with history test: {len(history)} -> {len(final_history)} entries")
\ No newline at end of file
+        print(f"Chat with history test: {len(history)} -> {len(final_history)} entries")
+
+def test_tool_call_stream_matches_whole_text_sanitising():
+    """Incremental sanitising must agree with sanitize_tool_calls on the full reply"""
+    import html
+    from src.gradio.app import _ToolCallStream, sanitize_tool_calls, CHARACTERS
+
+    reply = 'Let me check <b>that</b> function=search>{"q": "a&b"}</function> - found it. function=look'
+    full = sanitize_tool_calls(reply)
+    for size in (1, 3, 7, len(reply)):
+        stream = _ToolCallStream()
+        for start in range(0, len(reply), size):
+            stream.feed(reply[start:start + size])
+        entry = stream.entry(CHARACTERS[0])
+        assert entry["content"] == full
+        assert entry["content_html"] == html.escape(full, quote=False)
@@ -152,10 +152,15 @@ async def test_run_deliberation_and_export():
     
     question = "How do birds navigate?"
     
-    # Test export function
-    display_html, tmp_path = await run_deliberation_and_export(
-        question, rounds=1, summariser="moderator"
-    )
+    # Test export function - streams one update per phase, then the final result
+    updates = [
+        update async for update in run_deliberation_and_export(
+            question, rounds=1, summariser="moderator"
+        )
+    ]
+    assert len(updates) == 4, f"Expected 3 phase updates + final, got {len(updates)}"
+    assert all(path is None for _, path in updates[:-1]), "Only the final update carries the file"
+    display_html, tmp_path = updates[-1]
     
     # Should return HTML and file path
     assert isinstance(display_html, str), "Display should be HTML string"
@@ -169,3 +174,105 @@ async def test_run_deliberation_and_export():
     import os
     if os.path.exists(tmp_path):
         os.unlink(tmp_path)
+
+
+def test_rolling_excerpt_keeps_last_lines():
+    """Rolling excerpt should match a join of the last `limit` lines"""
+    from src.gradio.app import _RollingExcerpt
+
+    excerpt = _RollingExcerpt(limit=3)
+    lines = []
+    assert excerpt.text == ""
+    for i in range(5):
+        line = f"line {i}"
+        lines.append(line)
+        excerpt.append(line)
+        assert excerpt.text == "\n".join(lines[-3:])
+
+
+@pytest.mark.asyncio
+async def test_identical_replies_share_one_call():
+    """Concurrent identical deliberation prompts should hit the LLM once"""
+    from src.gradio.app import get_character_reply
+
+    class Echo:
+        name = "Echo"
+        calls = 0
+
+        async def respond(self, message, history, user_key=None):
+            Echo.calls += 1
+            await asyncio.sleep(0.05)
+            return message.upper()
+
+    char = Echo()
+    replies = await asyncio.gather(
+        get_character_reply(char, "caw"),
+        get_character_reply(char, "caw"),
+        get_character_reply(char, "kraa"),
+    )
+    assert replies == ["CAW", "CAW", "KRAA"]
+    assert Echo.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_reply_cancelled_only_when_all_callers_leave():
+    """A shared call outlives one cancelled caller but stops once nobody waits on it"""
+    from src.gradio.app import get_character_reply
+
+    class Slow:
+        name = "Slow"
+        finished = 0
+        cancelled = 0
+
+        async def respond(self, message, history, user_key=None):
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                Slow.cancelled += 1
+                raise
+            Slow.finished += 1
+            return message.upper()
+
+    char = Slow()
+    leaving = asyncio.create_task(get_character_reply(char, "caw"))
+    staying = asyncio.create_task(get_character_reply(char, "caw"))
+    await asyncio.sleep(0)
+    leaving.cancel()
+    assert await staying == "CAW"
+    assert (Slow.finished, Slow.cancelled) == (1, 0)
+
+    abandoned = asyncio.create_task(get_character_reply(char, "kraa"))
+    await asyncio.sleep(0.01)
+    abandoned.cancel()
+    await asyncio.sleep(0.01)
+    assert (Slow.finished, Slow.cancelled) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_provider_call_holds_its_slot_until_the_thread_ends():
+    """Cancelling can't stop a worker thread, so the LLM slot must stay taken until it returns"""
+    import time
+    from src.characters import Character
+
+    class Blocking(Character):
+        name = "Blocking"
+        default_location = "nowhere"
+
+        async def respond(self, message, history, user_key=None):
+            return await self._in_thread(time.sleep, 0.1)
+
+    slots = asyncio.Semaphore(1)
+
+    async def call():
+        async with slots:
+            await Blocking().respond("caw", [])
+
+    task = asyncio.create_task(call())
+    await asyncio.sleep(0.02)
+    task.cancel()
+    await asyncio.sleep(0.02)
+    assert slots.locked() and not task.done()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not slots.locked()